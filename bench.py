@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+# Frame extraction benchmark: compares a plain read-and-imwrite loop with
+# the shared memory FrameEncoder at 1..cpu_count worker processes.
+#
+#   python3 bench.py [--frames 120] [--width 1920] [--height 1080]
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from frame_encoder import FrameEncoder
+
+def make_clip(path, frames, width, height):
+    """Write a test clip whose frames all differ, so every frame gets encoded"""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), 30, (width, height))
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    for i in range(frames):
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        frame[:, :, 0] = (x + i * 4) % 256
+        frame[:, :, 1] = (y + i * 2) % 256
+        frame[:, :, 2] = (x * y / 255 + i) % 256
+        writer.write(frame)
+    writer.release()
+
+def run_baseline(clip, out_dir):
+    """Single process decode and PNG write, like the original extract_frames"""
+    cap = cv2.VideoCapture(clip)
+    count = 0
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        cv2.imwrite(os.path.join(out_dir, f"frame_{count:04d}.png"), frame)
+        count += 1
+    cap.release()
+    return count
+
+def run_encoder(clip, out_dir, workers):
+    """Decode into shared memory slots, hash and dedup, encode in worker processes"""
+    encoder = FrameEncoder(workers=workers)
+    cap = cv2.VideoCapture(clip)
+    seen = set()
+    count = 0
+
+    def on_frame(digest):
+        nonlocal count
+        count += 1
+        if digest in seen:
+            return None
+        seen.add(digest)
+        return os.path.join(out_dir, f"{digest}.png")
+
+    try:
+        encoder.decode(cap, on_frame)
+    finally:
+        cap.release()
+        encoder.shutdown()
+    return count
+
+def timed(function, *args):
+    start = time.perf_counter()
+    count = function(*args)
+    return count, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frame extraction throughput")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="hwplymouther-bench-")
+    try:
+        clip = os.path.join(work_dir, "clip.mp4")
+        make_clip(clip, args.frames, args.width, args.height)
+        out_dir = os.path.join(work_dir, "frames")
+
+        print(f"{args.frames} frames at {args.width}x{args.height}, {os.cpu_count()} CPUs")
+        print(f"{'mode':<20}{'seconds':>10}{'frames/s':>12}{'speedup':>10}")
+
+        os.makedirs(out_dir)
+        count, baseline = timed(run_baseline, clip, out_dir)
+        print(f"{'single process':<20}{baseline:>10.2f}{count / baseline:>12.1f}{1.0:>10.2f}")
+
+        for workers in range(1, args.max_workers + 1):
+            shutil.rmtree(out_dir)
+            os.makedirs(out_dir)
+            count, seconds = timed(run_encoder, clip, out_dir, workers)
+            label = f"{workers} worker{'s' if workers > 1 else ''}"
+            print(f"{label:<20}{seconds:>10.2f}{count / seconds:>12.1f}{baseline / seconds:>10.2f}")
+    finally:
+        shutil.rmtree(work_dir)
+
+if __name__ == "__main__":
+    main()
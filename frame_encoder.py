@@ -0,0 +1,249 @@
+# Encode workers live here, away from the GTK imports in main.py, so the
+# spawned worker processes only have to load OpenCV and NumPy.
+
+import os
+import sys
+import hashlib
+import queue
+import threading
+import multiprocessing
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+def attach_shared_memory(name):
+    """Attach to a ring created by the main process without tracking it here"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 has no track argument
+        return shared_memory.SharedMemory(name=name)
+
+def frame_digest(frame):
+    """Content hash used to deduplicate frames"""
+    digest = hashlib.blake2b(frame, digest_size=16)
+    digest.update(str(frame.shape).encode())
+    return digest.hexdigest()
+
+def encode_worker(job_queue, done_queue):
+    """Encode frames from shared memory ring slots into PNG files or PNG bytes"""
+    attached = {}
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+        
+        shm_name, slot, shape, dtype, path, to_memory, sequence = job
+        error = None
+        data = None
+        try:
+            if shm_name not in attached:
+                attached[shm_name] = attach_shared_memory(shm_name)
+            dtype = np.dtype(dtype)
+            frame_bytes = int(np.prod(shape)) * dtype.itemsize
+            frame = np.ndarray(shape, dtype=dtype, buffer=attached[shm_name].buf, offset=slot * frame_bytes)
+            if to_memory:
+                ok, encoded = cv2.imencode(".png", frame)
+                if ok:
+                    data = encoded.tobytes()
+                else:
+                    error = f"Could not encode {os.path.basename(path)}"
+            elif not cv2.imwrite(path, frame):
+                error = f"Could not write {os.path.basename(path)}"
+            frame = None  # drop the view so the ring can be closed
+        except Exception as e:
+            error = str(e)
+        
+        # Hand the slot back to the decoder
+        done_queue.put((shm_name, slot, error, path, data, sequence))
+    
+    for shm in attached.values():
+        shm.close()
+
+class FrameRing:
+    """Preallocated shared memory slots that decoded frames are written into"""
+    
+    def __init__(self, shape, dtype, slot_count):
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self.slot_count = slot_count
+        
+        frame_bytes = int(np.prod(shape)) * self.dtype.itemsize
+        self.shm = shared_memory.SharedMemory(create=True, size=frame_bytes * slot_count)
+        self.name = self.shm.name
+        self.slots = [
+            np.ndarray(shape, dtype=self.dtype, buffer=self.shm.buf, offset=i * frame_bytes)
+            for i in range(slot_count)
+        ]
+        
+        self.free_slots = queue.Queue()
+        for i in range(slot_count):
+            self.free_slots.put(i)
+    
+    def release(self, slot):
+        self.free_slots.put(slot)
+    
+    def close(self):
+        self.slots = []
+        self.shm.close()
+        self.shm.unlink()
+
+class FrameEncoder:
+    """Pool of encode processes fed with ring slot indices instead of pickled frames"""
+    
+    # Upper bound on shared memory per ring (256 MiB)
+    RING_BYTES = 256 * 1024 * 1024
+    
+    def __init__(self, workers=None, sink=None):
+        context = multiprocessing.get_context("spawn")  # forking the GTK app is unsafe
+        self.workers = workers or os.cpu_count() or 1
+        self.sink = sink  # receives (name, png_bytes) for frames encoded in memory
+        self.job_queue = context.Queue()
+        self.done_queue = context.Queue()
+        self.rings = {}
+        self.errors = []
+        
+        # Frames encoded in memory reach the sink in the order they were queued
+        self.sequence_lock = threading.Lock()
+        self.next_sequence = 0
+        self.next_to_sink = 0
+        self.pending = {}
+        
+        # Spawned children re-run the parent's __main__ before starting the
+        # target; stand in for it while starting so they skip the GTK imports
+        main_module = sys.modules["__main__"]
+        sys.modules["__main__"] = sys.modules[__name__]
+        try:
+            self.processes = []
+            for _ in range(self.workers):
+                process = context.Process(target=encode_worker, args=(self.job_queue, self.done_queue), daemon=True)
+                process.start()
+                self.processes.append(process)
+        finally:
+            sys.modules["__main__"] = main_module
+        
+        self.dispatcher = threading.Thread(target=self.dispatch_done, daemon=True)
+        self.dispatcher.start()
+    
+    def dispatch_done(self):
+        while True:
+            message = self.done_queue.get()
+            if message is None:
+                return
+            shm_name, slot, error, path, data, sequence = message
+            ring = self.rings.get(shm_name)
+            if ring is not None:
+                ring.release(slot)
+            if error:
+                self.errors.append(error)
+            if sequence is None:
+                continue
+            
+            # Hold results that finished early until the ones queued before them arrive
+            self.pending[sequence] = (path, data)
+            while self.next_to_sink in self.pending:
+                path, data = self.pending.pop(self.next_to_sink)
+                self.next_to_sink += 1
+                if data is None:
+                    continue
+                try:
+                    self.sink(path, data)
+                except Exception as e:
+                    self.errors.append(str(e))
+    
+    def create_ring(self, shape, dtype):
+        frame_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        slot_count = max(2, min(self.workers * 2, self.RING_BYTES // frame_bytes))
+        ring = FrameRing(shape, dtype, slot_count)
+        self.rings[ring.name] = ring
+        return ring
+    
+    def wait_for_slot(self, ring):
+        """Wait for a free slot, failing instead of hanging if a worker died"""
+        while True:
+            try:
+                return ring.free_slots.get(timeout=1)
+            except queue.Empty:
+                if not all(process.is_alive() for process in self.processes):
+                    raise Exception("Frame encoder process exited unexpectedly")
+    
+    def acquire(self, ring):
+        # Stop decoding as soon as a worker reports a failure (e.g. disk full)
+        if self.errors:
+            raise Exception(self.errors[0])
+        return self.wait_for_slot(ring)
+    
+    def close_ring(self, ring):
+        try:
+            # Wait for every in-flight slot to come back before unmapping
+            for _ in range(ring.slot_count):
+                self.wait_for_slot(ring)
+        finally:
+            del self.rings[ring.name]
+            ring.close()
+    
+    def decode(self, cap, on_frame, end_msec=0, to_memory=False):
+        """Decode a capture through a ring of shared memory slots.
+        
+        on_frame gets each frame's content hash and returns the path (or
+        archive name) to encode it to, or None to drop it as a duplicate.
+        Decoding stops before end_msec when it is set.
+        """
+        ring = None
+        slot = None  # slot held by this thread, not yet queued or released
+        try:
+            while True:
+                if ring is None:
+                    # The first frame sizes the ring
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    ring = self.create_ring(frame.shape, frame.dtype)
+                    slot = self.acquire(ring)
+                    np.copyto(ring.slots[slot], frame)
+                else:
+                    # Decode straight into a free shared memory slot
+                    slot = self.acquire(ring)
+                    ret, frame = cap.read(ring.slots[slot])
+                    if not ret:
+                        break
+                    if frame is not ring.slots[slot]:
+                        if frame.shape != ring.shape:
+                            raise Exception("Frame size changes mid-clip")
+                        np.copyto(ring.slots[slot], frame)
+                
+                if end_msec and cap.get(cv2.CAP_PROP_POS_MSEC) >= end_msec:
+                    break
+                
+                path = on_frame(frame_digest(ring.slots[slot]))
+                if path is None:
+                    ring.release(slot)
+                else:
+                    self.encode(ring, slot, path, to_memory)
+                slot = None
+        finally:
+            if ring is not None:
+                # close_ring waits for every slot, so hand back the one still held
+                if slot is not None:
+                    ring.release(slot)
+                self.close_ring(ring)
+    
+    def encode(self, ring, slot, path, to_memory=False):
+        sequence = None
+        if to_memory:
+            with self.sequence_lock:
+                sequence = self.next_sequence
+                self.next_sequence += 1
+        self.job_queue.put((ring.name, slot, ring.shape, ring.dtype.str, path, to_memory, sequence))
+    
+    def shutdown(self, raise_errors=True):
+        for _ in self.processes:
+            self.job_queue.put(None)
+        for process in self.processes:
+            process.join()
+        self.done_queue.put(None)
+        self.dispatcher.join()
+        
+        if raise_errors and self.errors:
+            raise Exception(self.errors[0])
@@ -10,6 +10,12 @@ import threading
 import shutil
 import subprocess
 import json
+import hashlib
+import gzip
+import io
+import re
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tempfile
 import webbrowser
@@ -17,10 +23,94 @@ import webbrowser
 try:
     import cv2
     import numpy as np
+    from frame_encoder import FrameEncoder
     HAS_OPENCV = True
 except ImportError:
     HAS_OPENCV = False
 
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+class ThemeArchive:
+    """Single-file theme archive that files are streamed into as they are produced"""
+    
+    EXTENSIONS = {"tar.gz": ".tar.gz", "tar.zst": ".tar.zst", "deb": "_deb.tar.gz"}
+    
+    def __init__(self, path, export_format, theme_name, theme_desc, mtime):
+        self.path = path
+        self.mtime = mtime  # one timestamp for every entry keeps the archive reproducible
+        self.export_format = export_format
+        self.theme_name = theme_name
+        self.theme_desc = theme_desc
+        self.hashes = {}
+        self.lock = threading.Lock()
+        
+        # Debian layouts are rooted at / so the tree can go straight to dpkg-deb
+        if export_format == "deb":
+            self.prefix = f"usr/share/plymouth/themes/{theme_name}/"
+        else:
+            self.prefix = f"{theme_name}/"
+        
+        self.file = open(path, 'wb')
+        if export_format == "tar.zst":
+            self.compressor = zstandard.ZstdCompressor().stream_writer(self.file)
+        else:
+            # tarfile's own gzip stream stamps the header with the current time
+            self.compressor = gzip.GzipFile(filename="", mode='wb', fileobj=self.file, mtime=mtime)
+        self.tar = tarfile.open(fileobj=self.compressor, mode='w|')
+    
+    def add_raw(self, name, data, mode=0o644):
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = self.mtime
+        info.mode = mode
+        info.uname = info.gname = "root"
+        with self.lock:
+            self.tar.addfile(info, io.BytesIO(data))
+    
+    def add_file(self, name, data):
+        """Add a file relative to the theme directory and record its hash"""
+        self.add_raw(self.prefix + name, data)
+        self.hashes[name] = hashlib.sha256(data).hexdigest()
+    
+    def close(self):
+        # Manifest in sha256sum format so installs can run sha256sum -c
+        manifest = "".join(f"{digest}  {name}\n" for name, digest in sorted(self.hashes.items()))
+        self.add_raw(self.prefix + "MANIFEST.sha256", manifest.encode())
+        
+        if self.export_format == "deb":
+            self.add_raw("DEBIAN/control", self.debian_control().encode())
+        
+        self.tar.close()
+        self.compressor.close()
+        self.file.close()
+    
+    def discard(self):
+        """Drop a partially written archive after a failed generation"""
+        try:
+            self.tar.close()
+            self.compressor.close()
+        except Exception:
+            pass
+        self.file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+    
+    def debian_control(self):
+        package = re.sub(r'[^a-z0-9+.-]+', '-', self.theme_name.lower()).strip('-') or "theme"
+        description = self.theme_desc or f"{self.theme_name} boot animation"
+        return f"""Package: plymouth-theme-{package}
+Version: 1.0
+Architecture: all
+Maintainer: HwPlymouther
+Depends: plymouth
+Description: {self.theme_name} Plymouth theme
+ {description}
+"""
+
 class HwPlymouther(Adw.Application):
     def __init__(self):
         super().__init__(application_id='com.malikhw47.hwplymouther')
@@ -32,8 +122,18 @@ class HwPlymouther(Adw.Application):
         self.aspect_handling = "center"  # center, stretch, fill
         self.animation_mode = "loop"  # loop, times, boot_progress
         self.play_times = 1
-        self.frames = []
+        self.start_time = 0  # seconds into the clip
+        self.end_time = 0  # 0 = until the end of the clip
+        self.streaming = False
+        self.stream_window = 10
+        self.segments = []  # extra intro/outro segments around the main animation
+        self.frames = []  # deduplicated frame pool shared by all segments
+        self.frame_names = []  # theme-relative file name of each pool frame
+        self.segment_frames = []  # per-segment lists of frame pool indices
+        self.export_format = "folder"  # folder, tar.gz, tar.zst, deb
+        self.archive = None
         self.output_dir = ""
+        self.output_file = ""
         
     def do_activate(self):
         self.main_window = MainWindow(self)
@@ -205,6 +305,22 @@ class MainWindow(Adw.ApplicationWindow):
         self.mode_row.connect("notify::selected", self.on_mode_changed)
         
         mode_group.add(self.mode_row)
+        
+        # Time range, e.g. to loop the part of a clip after its intro
+        self.start_row = Adw.SpinRow()
+        self.start_row.set_title("Start time (seconds)")
+        self.start_row.set_adjustment(Gtk.Adjustment(value=0, lower=0, upper=3600, step_increment=0.5))
+        self.start_row.set_digits(1)
+        self.start_row.connect("changed", self.on_start_changed)
+        mode_group.add(self.start_row)
+        
+        self.end_row = Adw.SpinRow()
+        self.end_row.set_title("End time (seconds, 0 = end of clip)")
+        self.end_row.set_adjustment(Gtk.Adjustment(value=0, lower=0, upper=3600, step_increment=0.5))
+        self.end_row.set_digits(1)
+        self.end_row.connect("changed", self.on_end_changed)
+        mode_group.add(self.end_row)
+        
         content_box.append(mode_group)
         
         # Times setting (initially hidden)
@@ -221,6 +337,72 @@ class MainWindow(Adw.ApplicationWindow):
         self.times_group.add(self.times_row)
         content_box.append(self.times_group)
         
+        # Streaming playback
+        stream_group = Adw.PreferencesGroup()
+        stream_group.set_title("Streaming Playback")
+        stream_group.set_description("Load frames on demand instead of all at boot (for long animations)")
+        
+        self.stream_row = Adw.SwitchRow()
+        self.stream_row.set_title("Stream frames")
+        self.stream_row.connect("notify::active", self.on_stream_changed)
+        stream_group.add(self.stream_row)
+        
+        self.window_row = Adw.SpinRow()
+        self.window_row.set_title("Frames kept loaded")
+        window_adjustment = Gtk.Adjustment(value=10, lower=2, upper=200, step_increment=1)
+        self.window_row.set_adjustment(window_adjustment)
+        self.window_row.set_visible(False)
+        self.window_row.connect("changed", self.on_window_changed)
+        stream_group.add(self.window_row)
+        
+        content_box.append(stream_group)
+        
+        # Extra segments (intro/outro)
+        self.segments_group = Adw.PreferencesGroup()
+        self.segments_group.set_title("Segments")
+        self.segments_group.set_description(
+            "Add an intro or outro that plays around the main animation. "
+            "An outro cannot follow an endless loop, so the main animation "
+            "must play a specific number of times"
+        )
+        
+        add_segment_button = Gtk.Button()
+        add_segment_button.set_icon_name("list-add-symbolic")
+        add_segment_button.set_tooltip_text("Add Segment")
+        add_segment_button.connect("clicked", self.on_add_segment_clicked)
+        self.segments_group.set_header_suffix(add_segment_button)
+        
+        self.segment_rows = []
+        content_box.append(self.segments_group)
+        
+        self.segments_warning = Gtk.Label()
+        self.segments_warning.add_css_class("error")
+        self.segments_warning.set_wrap(True)
+        self.segments_warning.set_visible(False)
+        content_box.append(self.segments_warning)
+        
+        # Export format
+        export_group = Adw.PreferencesGroup()
+        export_group.set_title("Output")
+        
+        self.export_formats = [("folder", "Folder")]
+        self.export_formats.append(("tar.gz", "Single archive (.tar.gz)"))
+        if HAS_ZSTD:
+            self.export_formats.append(("tar.zst", "Single archive (.tar.zst)"))
+        self.export_formats.append(("deb", "Debian package layout (.tar.gz)"))
+        
+        self.export_row = Adw.ComboRow()
+        self.export_row.set_title("Export Format")
+        export_model = Gtk.StringList()
+        for _, label in self.export_formats:
+            export_model.append(label)
+        self.export_row.set_model(export_model)
+        self.export_row.set_selected(0)
+        self.export_row.connect("notify::selected", self.on_export_changed)
+        
+        export_group.add(self.export_row)
+        content_box.append(export_group)
+        
         # Navigation buttons
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         button_box.set_halign(Gtk.Align.CENTER)
@@ -230,11 +412,11 @@ class MainWindow(Adw.ApplicationWindow):
         back_button.connect("clicked", self.on_back_welcome)
         button_box.append(back_button)
         
-        generate_button = Gtk.Button()
-        generate_button.set_label("Generate Theme")
-        generate_button.add_css_class("suggested-action")
-        generate_button.connect("clicked", self.on_generate)
-        button_box.append(generate_button)
+        self.generate_button = Gtk.Button()
+        self.generate_button.set_label("Generate Theme")
+        self.generate_button.add_css_class("suggested-action")
+        self.generate_button.connect("clicked", self.on_generate)
+        button_box.append(self.generate_button)
         
         content_box.append(button_box)
         
@@ -310,9 +492,9 @@ class MainWindow(Adw.ApplicationWindow):
         can_proceed = bool(self.app.theme_name and self.app.input_file)
         self.next_button.set_sensitive(can_proceed)
     
-    def on_file_clicked(self, button):
+    def create_file_dialog(self, title):
         dialog = Gtk.FileChooserDialog(
-            title="Select Animation File",
+            title=title,
             parent=self,
             action=Gtk.FileChooserAction.OPEN
         )
@@ -346,6 +528,10 @@ class MainWindow(Adw.ApplicationWindow):
         filter_image.add_mime_type("image/jpeg")
         dialog.add_filter(filter_image)
         
+        return dialog
+    
+    def on_file_clicked(self, button):
+        dialog = self.create_file_dialog("Select Animation File")
         dialog.connect("response", self.on_file_dialog_response)
         dialog.present()
     
@@ -419,10 +605,164 @@ class MainWindow(Adw.ApplicationWindow):
         elif selected == 2:
             self.app.animation_mode = "boot_progress"
             self.times_group.set_visible(False)
+        self.update_generate_button()
     
     def on_times_changed(self, spin):
         self.app.play_times = int(spin.get_value())
     
+    def on_start_changed(self, spin):
+        self.app.start_time = spin.get_value()
+        self.update_generate_button()
+    
+    def on_end_changed(self, spin):
+        self.app.end_time = spin.get_value()
+        self.update_generate_button()
+    
+    def on_stream_changed(self, switch, param):
+        self.app.streaming = switch.get_active()
+        self.window_row.set_visible(self.app.streaming)
+    
+    def on_window_changed(self, spin):
+        self.app.stream_window = int(spin.get_value())
+    
+    def on_export_changed(self, combo, param):
+        self.app.export_format = self.export_formats[combo.get_selected()][0]
+    
+    def segment_order_error(self):
+        """Return why the segments cannot be generated, or None if they can"""
+        segments = self.theme_segments()
+        for segment in segments:
+            if segment["end_time"] and segment["end_time"] <= segment["start_time"]:
+                if segment["placement"] == "main":
+                    name = "the main animation"
+                else:
+                    name = os.path.basename(segment["input_file"])
+                return f"The end time of {name} must be after its start time."
+        
+        for segment in segments[:-1]:
+            if segment["mode"] == "times":
+                continue
+            if segment["placement"] == "main":
+                return "An outro cannot follow an endless loop. Set the main animation to play a specific number of times."
+            return "Only the last outro can loop."
+        return None
+    
+    def update_generate_button(self):
+        error = self.segment_order_error()
+        self.segments_warning.set_text(error or "")
+        self.segments_warning.set_visible(error is not None)
+        self.generate_button.set_sensitive(error is None)
+    
+    def on_add_segment_clicked(self, button):
+        dialog = self.create_file_dialog("Select Segment File")
+        dialog.connect("response", self.on_segment_dialog_response)
+        dialog.present()
+    
+    def on_segment_dialog_response(self, dialog, response):
+        if response == Gtk.ResponseType.ACCEPT:
+            file = dialog.get_file()
+            if file:
+                segment = {
+                    "input_file": file.get_path(),
+                    "placement": "intro",  # intro, outro
+                    "mode": "times",  # times, loop
+                    "play_times": 1,
+                    "start_time": 0,
+                    "end_time": 0  # 0 = until the end of the clip
+                }
+                self.app.segments.append(segment)
+                self.add_segment_row(segment)
+                self.update_generate_button()
+        
+        dialog.destroy()
+    
+    def add_segment_row(self, segment):
+        row = Adw.ExpanderRow()
+        row.set_title(os.path.basename(segment["input_file"]))
+        row.set_subtitle("Intro")
+        
+        remove_button = Gtk.Button()
+        remove_button.set_icon_name("user-trash-symbolic")
+        remove_button.set_tooltip_text("Remove Segment")
+        remove_button.set_valign(Gtk.Align.CENTER)
+        remove_button.add_css_class("flat")
+        row.add_suffix(remove_button)
+        
+        placement_row = Adw.ComboRow()
+        placement_row.set_title("Placement")
+        placement_model = Gtk.StringList()
+        placement_model.append("Intro (before main animation)")
+        placement_model.append("Outro (after main animation)")
+        placement_row.set_model(placement_model)
+        row.add_row(placement_row)
+        
+        # Intros always play a set number of times; only outros may loop
+        mode_row = Adw.ComboRow()
+        mode_row.set_title("Playback Mode")
+        mode_model = Gtk.StringList()
+        mode_model.append("Play specific number of times")
+        mode_model.append("Loop continuously")
+        mode_row.set_model(mode_model)
+        mode_row.set_visible(False)
+        row.add_row(mode_row)
+        
+        times_row = Adw.SpinRow()
+        times_row.set_title("Number of times to play")
+        times_row.set_adjustment(Gtk.Adjustment(value=1, lower=1, upper=100, step_increment=1))
+        row.add_row(times_row)
+        
+        start_row = Adw.SpinRow()
+        start_row.set_title("Start time (seconds)")
+        start_row.set_adjustment(Gtk.Adjustment(value=0, lower=0, upper=3600, step_increment=0.5))
+        start_row.set_digits(1)
+        row.add_row(start_row)
+        
+        end_row = Adw.SpinRow()
+        end_row.set_title("End time (seconds, 0 = end of clip)")
+        end_row.set_adjustment(Gtk.Adjustment(value=0, lower=0, upper=3600, step_increment=0.5))
+        end_row.set_digits(1)
+        row.add_row(end_row)
+        
+        def on_placement_changed(combo, param):
+            segment["placement"] = "intro" if combo.get_selected() == 0 else "outro"
+            row.set_subtitle("Intro" if segment["placement"] == "intro" else "Outro")
+            mode_row.set_visible(segment["placement"] == "outro")
+            if segment["placement"] == "intro":
+                mode_row.set_selected(0)
+            self.update_generate_button()
+        
+        def on_mode_changed(combo, param):
+            segment["mode"] = "times" if combo.get_selected() == 0 else "loop"
+            times_row.set_visible(segment["mode"] == "times")
+            self.update_generate_button()
+        
+        def on_times_changed(spin):
+            segment["play_times"] = int(spin.get_value())
+        
+        def on_start_changed(spin):
+            segment["start_time"] = spin.get_value()
+            self.update_generate_button()
+        
+        def on_end_changed(spin):
+            segment["end_time"] = spin.get_value()
+            self.update_generate_button()
+        
+        def on_remove_clicked(button):
+            self.app.segments.remove(segment)
+            self.segment_rows.remove(row)
+            self.segments_group.remove(row)
+            self.update_generate_button()
+        
+        placement_row.connect("notify::selected", on_placement_changed)
+        mode_row.connect("notify::selected", on_mode_changed)
+        times_row.connect("changed", on_times_changed)
+        start_row.connect("changed", on_start_changed)
+        end_row.connect("changed", on_end_changed)
+        remove_button.connect("clicked", on_remove_clicked)
+        
+        self.segments_group.add(row)
+        self.segment_rows.append(row)
+    
     def on_back_welcome(self, button):
         self.stack.set_visible_child_name("welcome")
     
@@ -436,18 +776,35 @@ class MainWindow(Adw.ApplicationWindow):
     def generate_theme(self):
         """Generate the Plymouth theme"""
         try:
+            error = self.segment_order_error()
+            if error:
+                raise Exception(error)
+            
             GLib.idle_add(self.update_progress, "Creating output directory...")
             
             # Create output directory
             base_dir = os.path.expanduser("~/Documents/HwPlymouther")
             os.makedirs(base_dir, exist_ok=True)
             
-            theme_dir = os.path.join(base_dir, self.app.theme_name)
-            if os.path.exists(theme_dir):
-                shutil.rmtree(theme_dir)
-            os.makedirs(theme_dir)
-            
-            self.app.output_dir = theme_dir
+            if self.app.export_format == "folder":
+                theme_dir = os.path.join(base_dir, self.app.theme_name)
+                if os.path.exists(theme_dir):
+                    shutil.rmtree(theme_dir)
+                os.makedirs(theme_dir)
+                
+                self.app.output_dir = theme_dir
+                self.app.output_file = ""
+            else:
+                # Archives are streamed to one file; nothing else touches the disk
+                extension = ThemeArchive.EXTENSIONS[self.app.export_format]
+                self.app.output_dir = base_dir
+                self.app.output_file = os.path.join(base_dir, f"{self.app.theme_name}{extension}")
+                # Stamp entries with the newest input so the same inputs give the same archive
+                mtime = int(max(os.path.getmtime(segment["input_file"]) for segment in self.theme_segments()))
+                self.app.archive = ThemeArchive(
+                    self.app.output_file, self.app.export_format,
+                    self.app.theme_name, self.app.theme_desc, mtime
+                )
             
             GLib.idle_add(self.update_progress, "Extracting frames...")
             
@@ -459,67 +816,190 @@ class MainWindow(Adw.ApplicationWindow):
             # Create Plymouth theme files
             self.create_plymouth_files()
             
+            if self.app.archive is not None:
+                self.app.archive.close()
+                self.app.archive = None
+            
             GLib.idle_add(self.update_progress, "Complete!")
             GLib.idle_add(self.on_generation_complete)
             
         except Exception as e:
+            if self.app.archive is not None:
+                self.app.archive.discard()
+                self.app.archive = None
             GLib.idle_add(self.on_generation_error, str(e))
     
+    def theme_segments(self):
+        """Return all segments in playback order: intros, main animation, outros"""
+        main_segment = {
+            "input_file": self.app.input_file,
+            "placement": "main",
+            "mode": self.app.animation_mode,
+            "play_times": self.app.play_times,
+            "start_time": self.app.start_time,
+            "end_time": self.app.end_time
+        }
+        intros = [segment for segment in self.app.segments if segment["placement"] == "intro"]
+        outros = [segment for segment in self.app.segments if segment["placement"] == "outro"]
+        return intros + [main_segment] + outros
+    
     def extract_frames(self):
-        """Extract frames from the input file"""
+        """Extract frames from every segment into a shared, deduplicated frame pool"""
         self.app.frames = []
+        self.app.frame_names = []
+        self.app.segment_frames = []
+        
+        # Archives receive encoded frames straight from the workers
+        archive = self.app.archive
+        temp_dir = os.path.join(self.app.output_dir, "frames_temp")
+        if archive is None:
+            os.makedirs(temp_dir, exist_ok=True)
         
-        if self.app.input_file.lower().endswith(('.png', '.jpg', '.jpeg')):
-            # Single image
-            self.app.frames = [self.app.input_file]
-        elif HAS_OPENCV:
+        # Frames are keyed by content while decoding; pool indices are only
+        # assigned afterwards so numbering does not depend on thread timing
+        sources = {}
+        sources_lock = threading.Lock()
+        
+        def claim(digest, source=None):
+            """Record where a frame comes from; True if it still needs encoding"""
+            with sources_lock:
+                if digest in sources:
+                    return False
+                if source is None and archive is None:
+                    source = os.path.join(temp_dir, f"{digest}.png")
+                sources[digest] = source  # None once streamed into the archive
+                return True
+        
+        def decode_segment(segment):
+            input_file = segment["input_file"]
+            
+            if input_file.lower().endswith(('.png', '.jpg', '.jpeg')):
+                # Single image
+                with open(input_file, 'rb') as f:
+                    digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+                claim(digest, source=input_file)
+                return [digest]
+            
+            if not HAS_OPENCV:
+                raise Exception("OpenCV not available for video/GIF processing")
+            
             # Video or GIF
-            cap = cv2.VideoCapture(self.app.input_file)
-            frame_count = 0
+            cap = cv2.VideoCapture(input_file)
+            if segment["start_time"] and not cap.set(cv2.CAP_PROP_POS_MSEC, segment["start_time"] * 1000):
+                cap.release()
+                raise Exception(f"Cannot seek to {segment['start_time']:g} s in {os.path.basename(input_file)}")
             
-            temp_dir = os.path.join(self.app.output_dir, "frames_temp")
-            os.makedirs(temp_dir, exist_ok=True)
+            digests = []
             
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                # Save frame
-                frame_path = os.path.join(temp_dir, f"frame_{frame_count:04d}.png")
-                cv2.imwrite(frame_path, frame)
-                self.app.frames.append(frame_path)
-                frame_count += 1
+            def on_frame(digest):
+                digests.append(digest)
+                if not claim(digest):
+                    return None
+                if archive is not None:
+                    # Streamed entries can't be renamed later, so name them by content
+                    return f"frames/frame_{digest}.png"
+                return sources[digest]
+            
+            try:
+                encoder.decode(cap, on_frame, segment["end_time"] * 1000, to_memory=archive is not None)
+            finally:
+                cap.release()
             
-            cap.release()
+            if not digests:
+                raise Exception(f"No frames found in {os.path.basename(input_file)}")
+            return digests
+        
+        segments = self.theme_segments()
+        has_video = any(
+            not segment["input_file"].lower().endswith(('.png', '.jpg', '.jpeg'))
+            for segment in segments
+        )
+        if HAS_OPENCV and has_video:
+            encoder = FrameEncoder(sink=archive.add_file if archive is not None else None)
         else:
-            raise Exception("OpenCV not available for video/GIF processing")
+            encoder = None
+        
+        # Decode segments concurrently; OpenCV releases the GIL while decoding.
+        # Archives decode one segment at a time so entries are written in a
+        # fixed order; encoding still runs in parallel in the workers.
+        decoders = 1 if archive is not None else len(segments)
+        try:
+            with ThreadPoolExecutor(max_workers=decoders) as executor:
+                segment_digests = list(executor.map(decode_segment, segments))
+        except Exception:
+            # Keep the decode error rather than a follow-up worker error
+            if encoder is not None:
+                encoder.shutdown(raise_errors=False)
+            raise
+        if encoder is not None:
+            encoder.shutdown()
+        
+        # Number the pool in segment order so output is stable between runs
+        pool_index = {}
+        for digests in segment_digests:
+            indices = []
+            for digest in digests:
+                if digest not in pool_index:
+                    index = len(self.app.frames)
+                    pool_index[digest] = index
+                    source = sources[digest]
+                    self.app.frames.append(source)
+                    if archive is not None:
+                        # Streamed frames are named by content; originals match them
+                        self.app.frame_names.append(f"frames/frame_{digest}.png")
+                    else:
+                        self.app.frame_names.append(f"frames/frame_{index:04d}.png")
+                indices.append(pool_index[digest])
+            self.app.segment_frames.append(indices)
     
     def create_plymouth_files(self):
         """Create Plymouth theme configuration files"""
         
+        archive = self.app.archive
+        
         # Copy and process frames
         frames_dir = os.path.join(self.app.output_dir, "frames")
-        os.makedirs(frames_dir, exist_ok=True)
+        if archive is None:
+            os.makedirs(frames_dir, exist_ok=True)
         
         processed_frames = []
-        for i, frame_path in enumerate(self.app.frames):
-            if frame_path.startswith(os.path.join(self.app.output_dir, "frames_temp")):
+        for frame_path, frame_name in zip(self.app.frames, self.app.frame_names):
+            if frame_path is None:
+                # Already streamed into the archive by the encoder
+                pass
+            elif archive is not None:
+                # Original file, pack it
+                with open(frame_path, 'rb') as f:
+                    archive.add_file(frame_name, f.read())
+            elif frame_path.startswith(os.path.join(self.app.output_dir, "frames_temp")):
                 # Temporary frame, move it
-                dest_path = os.path.join(frames_dir, f"frame_{i:04d}.png")
+                dest_path = os.path.join(self.app.output_dir, frame_name)
                 shutil.move(frame_path, dest_path)
             else:
                 # Original file, copy it
-                dest_path = os.path.join(frames_dir, f"frame_{i:04d}.png")
+                dest_path = os.path.join(self.app.output_dir, frame_name)
                 shutil.copy2(frame_path, dest_path)
             
-            processed_frames.append(f"frames/frame_{i:04d}.png")
+            processed_frames.append(frame_name)
         
         # Clean up temp directory
         temp_dir = os.path.join(self.app.output_dir, "frames_temp")
-        if os.path.exists(temp_dir):
+        if archive is None and os.path.exists(temp_dir):
             shutil.rmtree(temp_dir)
         
+        # Describe each segment by its frame pool indices
+        segments_config = []
+        for segment, indices in zip(self.theme_segments(), self.app.segment_frames):
+            segments_config.append({
+                "input_file": os.path.basename(segment["input_file"]),
+                "placement": segment["placement"],
+                "mode": segment["mode"],
+                "times": segment["play_times"] if segment["mode"] == "times" else None,
+                "start_time": segment["start_time"],
+                "end_time": segment["end_time"] or None,
+                "frames": indices
+            })
+        
         # Create theme configuration
         theme_config = {
             "name": self.app.theme_name,
@@ -527,9 +1007,19 @@ class MainWindow(Adw.ApplicationWindow):
             "frames": processed_frames,
             "mode": self.app.animation_mode,
             "times": self.app.play_times if self.app.animation_mode == "times" else None,
+            "streaming": self.app.streaming,
+            "stream_window": self.app.stream_window if self.app.streaming else None,
+            "segments": segments_config,
+            "export_format": self.app.export_format,
             "aspect_handling": self.app.aspect_handling
         }
         
+        # Archives point at the installed location instead of the build folder
+        if archive is not None:
+            theme_dir = f"/usr/share/plymouth/themes/{self.app.theme_name}"
+        else:
+            theme_dir = self.app.output_dir
+        
         # Write theme.plymouth file
         plymouth_content = f"""[Plymouth Theme]
 Name={self.app.theme_name}
@@ -537,31 +1027,25 @@ Description={self.app.theme_desc}
 ModuleName=script
 
 [script]
-ImageDir={os.path.join(self.app.output_dir)}
-ScriptFile={os.path.join(self.app.output_dir, f"{self.app.theme_name}.script")}
+ImageDir={theme_dir}
+ScriptFile={os.path.join(theme_dir, f"{self.app.theme_name}.script")}
 """
         
-        with open(os.path.join(self.app.output_dir, f"{self.app.theme_name}.plymouth"), 'w') as f:
-            f.write(plymouth_content)
+        self.write_theme_file(f"{self.app.theme_name}.plymouth", plymouth_content)
         
         # Create script file
         script_content = self.generate_script_content(processed_frames)
-        with open(os.path.join(self.app.output_dir, f"{self.app.theme_name}.script"), 'w') as f:
-            f.write(script_content)
+        self.write_theme_file(f"{self.app.theme_name}.script", script_content)
         
         # Write configuration JSON for reference
-        with open(os.path.join(self.app.output_dir, "theme_config.json"), 'w') as f:
-            json.dump(theme_config, f, indent=2)
+        self.write_theme_file("theme_config.json", json.dumps(theme_config, indent=2))
         
         # Create installation instructions
         install_instructions = f"""# {self.app.theme_name} Plymouth Theme
 
 ## Installation Instructions
 
-1. Copy this entire folder to /usr/share/plymouth/themes/:
-   ```
-   sudo cp -r "{self.app.output_dir}" /usr/share/plymouth/themes/
-   ```
+{self.install_steps()}
 
 2. Set as default theme:
    ```
@@ -578,24 +1062,83 @@ ScriptFile={os.path.join(self.app.output_dir, f"{self.app.theme_name}.script")}
 - Description: {self.app.theme_desc}
 - Frames: {len(processed_frames)}
 - Mode: {self.app.animation_mode}
+- Segments: {len(segments_config)}
+- Streaming: {f"yes ({self.app.stream_window} frames loaded)" if self.app.streaming else "no"}
 - Generated by HwPlymouther by MalikHw47
 """
         
-        with open(os.path.join(self.app.output_dir, "README.md"), 'w') as f:
-            f.write(install_instructions)
+        self.write_theme_file("README.md", install_instructions)
+    
+    def write_theme_file(self, name, content):
+        """Write a theme file into the output folder or stream it into the archive"""
+        data = content.encode()
+        if self.app.archive is not None:
+            self.app.archive.add_file(name, data)
+        else:
+            with open(os.path.join(self.app.output_dir, name), 'wb') as f:
+                f.write(data)
+    
+    def install_steps(self):
+        """First installation step for the chosen export format"""
+        if self.app.export_format == "folder":
+            return f"""1. Copy this entire folder to /usr/share/plymouth/themes/:
+   ```
+   sudo cp -r "{self.app.output_dir}" /usr/share/plymouth/themes/
+   ```"""
+        
+        archive_name = os.path.basename(self.app.output_file)
+        if self.app.export_format == "deb":
+            return f"""1. Build and install the package from the archive:
+   ```
+   mkdir pkg && tar -xzf "{archive_name}" -C pkg
+   dpkg-deb --root-owner-group --build pkg "{self.app.theme_name}.deb"
+   sudo apt install "./{self.app.theme_name}.deb"
+   ```"""
+        
+        tar_flag = "--zstd -xf" if self.app.export_format == "tar.zst" else "-xzf"
+        return f"""1. Extract the archive into /usr/share/plymouth/themes/ and verify it:
+   ```
+   sudo tar {tar_flag} "{archive_name}" -C /usr/share/plymouth/themes/
+   cd "/usr/share/plymouth/themes/{self.app.theme_name}" && sha256sum -c MANIFEST.sha256
+   ```"""
     
     def generate_script_content(self, frames):
         """Generate the Plymouth script content"""
         
+        segments = self.theme_segments()
+        sequence = [index for indices in self.app.segment_frames for index in indices]
+        
         script = f'''// {self.app.theme_name} Plymouth Script
 // Generated by HwPlymouther by MalikHw47
 
-// Load images
-images = [];
 '''
         
-        for i, frame in enumerate(frames):
-            script += f'images[{i}] = Image("{frame}");\n'
+        if self.app.streaming:
+            script += self.generate_streaming_loader(frames, len(sequence))
+        else:
+            script += '// Load images\nimages = [];\n'
+            for i, frame in enumerate(frames):
+                script += f'images[{i}] = Image("{frame}");\n'
+        
+        # Segment tables; sequence entries are indices into the image pool
+        mode_codes = {"loop": 0, "times": 1, "boot_progress": 2}
+        
+        script += '\n// Segments (modes: 0 = loop, 1 = times, 2 = progress)\nsequence = [];\n'
+        for i, index in enumerate(sequence):
+            script += f'sequence[{i}] = {index};\n'
+        
+        script += f'\nsegment_count = {len(segments)};\n'
+        script += 'segment_start = [];\nsegment_length = [];\nsegment_mode = [];\nsegment_times = [];\n'
+        start = 0
+        for i, (segment, indices) in enumerate(zip(segments, self.app.segment_frames)):
+            times = segment["play_times"] if segment["mode"] == "times" else 0
+            script += f'segment_start[{i}] = {start}; segment_length[{i}] = {len(indices)}; '
+            script += f'segment_mode[{i}] = {mode_codes[segment["mode"]]}; segment_times[{i}] = {times};\n'
+            start += len(indices)
+        
+        # Streaming keeps the window ahead of the shown frame loaded
+        stream_call = "stream_window();" if self.app.streaming else ""
+        initial_stream = "\nstream_window();\n" if self.app.streaming else ""
         
         script += f'''
 // Screen setup
@@ -603,71 +1146,125 @@ screen_width = Window.GetWidth();
 screen_height = Window.GetHeight();
 
 // Animation variables
-frame_count = {len(frames)};
+current_segment = 0;
 current_frame = 0;
-animation_time = 0;
-'''
-        
-        if self.app.animation_mode == "loop":
-            script += '''
-// Continuous loop mode
-fun refresh_callback() {
-    current_frame = (current_frame + 1) % frame_count;
-    
-    sprite = Sprite(images[current_frame]);
-    sprite.SetX((screen_width - images[current_frame].GetWidth()) / 2);
-    sprite.SetY((screen_height - images[current_frame].GetHeight()) / 2);
-    
-    Plymouth.SetRefreshRate(10); // 10 FPS
-}
-
-Plymouth.SetRefreshFunction(refresh_callback);
-'''
-        elif self.app.animation_mode == "times":
-            script += f'''
-// Play specific number of times
-play_times = {self.app.play_times};
 current_play = 0;
 animation_complete = 0;
+animation_time = 0;
 
-fun refresh_callback() {{
-    if (animation_complete) return;
+// Move on to the next segment, or stay on the last frame after the final one
+fun next_segment() {{
+    if (current_segment + 1 >= segment_count) {{
+        animation_complete = 1;
+        current_frame = segment_length[current_segment] - 1;
+        return;
+    }}
+    current_segment++;
+    current_frame = 0;
+    current_play = 0;
+}}
+
+// Step the segment state machine by one frame.
+// Only the last segment can be endless (loop or progress).
+fun advance_frame() {{
+    mode = segment_mode[current_segment];
+    length = segment_length[current_segment];
+    
+    if (mode == 2) {{
+        // Progress-based: follow boot progress
+        current_frame = Math.Int(Plymouth.GetBootProgress() * length);
+        if (current_frame >= length) current_frame = length - 1;
+        return;
+    }}
     
     current_frame++;
+    if (current_frame < length) return;
     
-    if (current_frame >= frame_count) {{
-        current_play++;
-        if (current_play >= play_times) {{
-            animation_complete = 1;
-            current_frame = frame_count - 1; // Stay on last frame
+    current_play++;
+    if (mode == 0) {{
+        current_frame = 0; // Loop forever
+    }} else {{
+        if (current_play >= segment_times[current_segment]) {{
+            next_segment();
         }} else {{
-            current_frame = 0; // Restart animation
+            current_frame = 0; // Restart segment
         }}
     }}
+}}
+{initial_stream}
+fun refresh_callback() {{
+    if (animation_complete) return;
+    
+    advance_frame();
+    image = sequence[segment_start[current_segment] + current_frame];
+    {stream_call}
     
-    sprite = Sprite(images[current_frame]);
-    sprite.SetX((screen_width - images[current_frame].GetWidth()) / 2);
-    sprite.SetY((screen_height - images[current_frame].GetHeight()) / 2);
+    sprite = Sprite(images[image]);
+    sprite.SetX((screen_width - images[image].GetWidth()) / 2);
+    sprite.SetY((screen_height - images[image].GetHeight()) / 2);
     
     Plymouth.SetRefreshRate(10); // 10 FPS
 }}
 
 Plymouth.SetRefreshFunction(refresh_callback);
 '''
-        else:  # boot_progress mode
-            script += '''
-// Progress-based animation
-fun refresh_callback() {
-    progress = Plymouth.GetBootProgress();
-    target_frame = Math.Int(progress * frame_count);
-    if (target_frame >= frame_count) target_frame = frame_count - 1;
-    
-    sprite = Sprite(images[target_frame]);
-    sprite.SetX((screen_width - images[target_frame].GetWidth()) / 2);
-    sprite.SetY((screen_height - images[target_frame].GetHeight()) / 2);
-}
+        
+        return script
+    
+    def generate_streaming_loader(self, frames, sequence_length):
+        """Generate the on-demand image loader used in streaming mode"""
+        
+        # A window as long as the whole sequence keeps every frame loaded
+        window = max(1, min(self.app.stream_window, sequence_length))
+        
+        script = '// Frame files (loaded on demand)\nframe_files = [];\n'
+        for i, frame in enumerate(frames):
+            script += f'frame_files[{i}] = "{frame}";\n'
+        
+        script += f'''
+images = [];
+keep = [];
+wanted = [];
+resident = [];
+stream_pass = 0;
+window_size = {window};
+for (i = 0; i < window_size; i++) resident[i] = -1;
 
-Plymouth.SetRefreshFunction(refresh_callback);
+// Pool image shown `offset` frames from now, following the segment order.
+// Loops wrap around so they restart without a loading gap.
+fun upcoming_image(offset) {{
+    seg = current_segment;
+    pos = current_frame + offset;
+    plays_left = segment_times[seg] - current_play;
+    while (pos >= segment_length[seg]) {{
+        if (segment_mode[seg] == 1 && plays_left > 1) {{
+            pos = pos - segment_length[seg];
+            plays_left = plays_left - 1;
+        }} else if (segment_mode[seg] == 1 && seg + 1 < segment_count) {{
+            pos = pos - segment_length[seg];
+            seg++;
+            plays_left = segment_times[seg];
+        }} else {{
+            pos = pos % segment_length[seg];
+        }}
+    }}
+    return sequence[segment_start[seg] + pos];
+}}
+
+// Load the upcoming window and release images that dropped out of it.
+// Images shared between segments stay loaded across transitions.
+fun stream_window() {{
+    stream_pass++;
+    for (i = 0; i < window_size; i++) {{
+        wanted[i] = upcoming_image(i);
+        keep[wanted[i]] = stream_pass;
+        if (!images[wanted[i]]) images[wanted[i]] = Image(frame_files[wanted[i]]);
+    }}
+    for (i = 0; i < window_size; i++) {{
+        if (resident[i] >= 0 && keep[resident[i]] != stream_pass) images[resident[i]] = NULL;
+        resident[i] = wanted[i];
+    }}
+}}
 '''
         
         return script
@@ -678,7 +1275,7 @@ Plymouth.SetRefreshFunction(refresh_callback);
     
     def on_generation_complete(self):
         self.complete_page.set_description(f"Your Plymouth theme '{self.app.theme_name}' has been successfully created!")
-        self.output_label.set_text(f"Theme location:\n{self.app.output_dir}")
+        self.output_label.set_text(f"Theme location:\n{self.app.output_file or self.app.output_dir}")
         self.stack.set_visible_child_name("complete")
     
     def on_generation_error(self, error_msg):
@@ -702,18 +1299,37 @@ Plymouth.SetRefreshFunction(refresh_callback);
         self.app.aspect_handling = "center"
         self.app.animation_mode = "loop"
         self.app.play_times = 1
+        self.app.start_time = 0
+        self.app.end_time = 0
+        self.app.streaming = False
+        self.app.stream_window = 10
+        self.app.segments = []
         self.app.frames = []
+        self.app.frame_names = []
+        self.app.segment_frames = []
+        self.app.export_format = "folder"
+        self.app.archive = None
         self.app.output_dir = ""
+        self.app.output_file = ""
         
         # Reset UI
         self.name_row.set_text("")
         self.desc_row.set_text("")
-        self.file_row.set_subtitle("No file selected")
+        self.file_label.set_text("No file selected")
         self.aspect_group.set_visible(False)
         self.aspect_row.set_selected(0)
         self.mode_row.set_selected(0)
         self.times_group.set_visible(False)
         self.times_row.set_value(1)
+        self.start_row.set_value(0)
+        self.end_row.set_value(0)
+        self.stream_row.set_active(False)
+        self.window_row.set_value(10)
+        for row in self.segment_rows:
+            self.segments_group.remove(row)
+        self.segment_rows = []
+        self.update_generate_button()
+        self.export_row.set_selected(0)
         self.next_button.set_sensitive(False)
         
         # Go back to welcome page